@@ -19,18 +19,22 @@ import re
 import sys
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Any, Iterable, Pattern, Union
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import pandas as pd
+    from dateutil.tz import tzlocal
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.utils import get_column_letter
     from openpyxl.utils.dataframe import dataframe_to_rows
 except ImportError as e:
     print(f"Required package missing: {e}")
-    print("Install required packages: pip install pandas openpyxl")
+    print("Install required packages: pip install pandas openpyxl python-dateutil")
     sys.exit(1)
 
 
@@ -46,6 +50,50 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Number of threads used to scan top-level subdirectories concurrently
+DEFAULT_SCAN_WORKERS = 8
+
+# Directories that never contain VectorCAST reports; pruned from the walk
+SKIP_DIRS = frozenset({'.git', '.svn', '.hg', '__pycache__', 'node_modules', '.venv', 'venv'})
+
+# Excel header styles
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+
+# Directory tree icons by file extension
+FOLDER_ICON = '📁'
+DEFAULT_FILE_ICON = '📄'
+FILE_ICONS: Dict[str, str] = {
+    '.html': '🌐',
+    '.xml': '📄',
+    '.json': '📋',
+    '.csv': '📊',
+    '.xlsx': '📈',
+    '.py': '🐍',
+    '.txt': '📝',
+    '.log': '📃'
+}
+
+# Raw per-report fields gathered during the scan:
+# (filename, full_path, relative_path, size_bytes, mtime, directory)
+ReportRow = Tuple[str, str, str, int, Optional[float], str]
+REPORT_ROW_COLUMNS = ('filename', 'full_path', 'relative_path', 'size_bytes', 'mtime', 'directory')
+REPORT_ROW_DTYPES = {'size_bytes': 'int64', 'mtime': 'float64'}
+
+# Columns of the per-report-type sheets, in output order
+REPORT_COLUMNS = ['filename', 'full_path', 'relative_path', 'size_bytes', 'size_mb', 'modified_date', 'directory']
+
+# VectorCAST report filename suffixes (lower-case, of the form '.<name>.<ext>')
+# mapped to report type
+REPORT_SUFFIXES: Dict[str, str] = {
+    '.full_report.html': 'full_report',
+    '.metrics_report.html': 'metrics_report',
+    '.testcase_management_report.html': 'testcase_report',
+    '.coverage_report.html': 'coverage_report',
+    '.execution_report.html': 'execution_report'
+}
+
 
 class VectorCASTReportAnalyser:
     """
@@ -55,116 +103,258 @@ class VectorCASTReportAnalyser:
     extracting VectorCAST report information, and generating structured Excel reports.
     """
     
-    def __init__(self, root_directory: str = "."):
+    def __init__(self, root_directory: str = ".", skip_dirs: Optional[Iterable[str]] = None):
         """
         Initialize the VectorCAST Report Analyser.
         
         Args:
             root_directory (str): Root directory to scan for reports
+            skip_dirs (Iterable[str], optional): Directory names that are listed
+                in the tree but not scanned for reports (default: SKIP_DIRS)
         """
         self.root_directory = Path(root_directory).resolve()
-        self.report_patterns = {
-            'full_report': r'.*\.Full_Report\.html$',
-            'metrics_report': r'.*\.Metrics_Report\.html$',
-            'testcase_report': r'.*\.Testcase_Management_Report\.html$',
-            'coverage_report': r'.*\.Coverage_Report\.html$',
-            'execution_report': r'.*\.Execution_Report\.html$'
-        }
+        # Length of the root path including its trailing separator, used to
+        # slice relative paths out of DirEntry.path
+        self._root_prefix_len = len(os.path.join(str(self.root_directory), ''))
+        self.report_suffixes: Dict[str, str] = dict(REPORT_SUFFIXES)
+        self.skip_dirs = frozenset(SKIP_DIRS if skip_dirs is None else skip_dirs)
         self.extracted_data: Dict[str, List[str]] = {}
         self.directory_tree: List[str] = []
     
-    def generate_directory_tree(self, output_file: Optional[str] = None) -> List[str]:
+    def generate_directory_tree(self, output_file: Optional[str] = None,
+                                include_icons: bool = True) -> List[str]:
         """
         Generate a directory tree structure of the specified directory.
         
         Args:
             output_file (str, optional): File to save the tree structure
+            include_icons (bool): Prefix entries with folder/file-type icons
             
         Returns:
             List[str]: Directory tree structure as list of strings
         """
         logger.info(f"Generating directory tree for: {self.root_directory}")
         
-        tree_lines = []
-        tree_lines.append(f"Directory Tree for: {self.root_directory}")
-        tree_lines.append("=" * 50)
-        
-        def add_tree_line(path: Path, prefix: str = "") -> None:
-            """Add a line to the tree structure."""
-            if path.is_dir():
-                tree_lines.append(f"{prefix}📁 {path.name}/")
-                try:
-                    items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
-                    for i, item in enumerate(items):
-                        is_last = i == len(items) - 1
-                        new_prefix = prefix + ("    " if is_last else "│   ")
-                        connector = "└── " if is_last else "├── "
-                        
-                        if item.is_dir():
-                            tree_lines.append(f"{prefix}{connector}📁 {item.name}/")
-                            add_tree_line(item, new_prefix)
-                        else:
-                            icon = self._get_file_icon(item.suffix)
-                            tree_lines.append(f"{prefix}{connector}{icon} {item.name}")
-                            
-                except PermissionError:
-                    tree_lines.append(f"{prefix}    [Permission Denied]")
-        
-        add_tree_line(self.root_directory)
+        tree_lines, _ = self._walk_once(include_tree=True, include_icons=include_icons, find_reports=False)
+        self._set_directory_tree(tree_lines)
         
         if output_file:
             try:
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(tree_lines))
+                    f.write('\n'.join(self.directory_tree))
                 logger.info(f"Directory tree saved to: {output_file}")
             except Exception as e:
                 logger.error(f"Failed to save directory tree: {e}")
         
-        self.directory_tree = tree_lines
-        return tree_lines
+        return self.directory_tree
+    
+    def _set_directory_tree(self, tree_lines: List[str]) -> None:
+        """Store the rendered tree, prefixed with its title lines."""
+        self.directory_tree = [
+            f"Directory Tree for: {self.root_directory}",
+            "=" * 50
+        ] + tree_lines
     
     def _get_file_icon(self, extension: str) -> str:
         """Get appropriate icon for file extension."""
-        icons = {
-            '.html': '🌐',
-            '.xml': '📄',
-            '.json': '📋',
-            '.csv': '📊',
-            '.xlsx': '📈',
-            '.py': '🐍',
-            '.txt': '📝',
-            '.log': '📃'
-        }
-        return icons.get(extension.lower(), '📄')
+        return FILE_ICONS.get(extension.lower(), DEFAULT_FILE_ICON)
     
-    def extract_file_names(self, content: str, pattern: str) -> List[str]:
+    def extract_file_names(self, content: str, pattern: Union[str, Pattern[str]]) -> List[str]:
         """
         Extract filenames from content based on a regex pattern.
         
         Args:
             content (str): Content to search in
-            pattern (str): Regex pattern to match
+            pattern (str | Pattern): Regex pattern to match, either as a string
+                or pre-compiled with re.compile
             
         Returns:
             List[str]: List of matching filenames
         """
         try:
-            matches = re.findall(pattern, content, re.MULTILINE | re.IGNORECASE)
-            return list(set(matches))  # Remove duplicates
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+            matches = pattern.findall(content)
+            return list(dict.fromkeys(matches))  # Remove duplicates, keeping order
         except re.error as e:
             logger.error(f"Invalid regex pattern '{pattern}': {e}")
             return []
     
-    def scan_directory_for_reports(self) -> Dict[str, List[Dict[str, Any]]]:
+    def scan_directory_for_reports(self, max_workers: int = DEFAULT_SCAN_WORKERS) -> Dict[str, pd.DataFrame]:
         """
         Scan directory for VectorCAST report files and extract metadata.
         
+        Args:
+            max_workers (int): Number of threads used to scan subdirectories
+            
         Returns:
-            Dict[str, List[Dict[str, Any]]]: Dictionary containing report information
+            Dict[str, pd.DataFrame]: One DataFrame of report metadata per report type
         """
         logger.info("Scanning directory for VectorCAST reports...")
         
-        report_data = {
+        _, found = self._walk_once(include_tree=False, max_workers=max_workers)
+        return self._group_reports(found)
+    
+    def analyse_directory(self, include_tree: bool = True, include_icons: bool = True,
+                          max_workers: int = DEFAULT_SCAN_WORKERS) -> Dict[str, pd.DataFrame]:
+        """
+        Generate the directory tree and scan for reports in a single traversal.
+        
+        The rendered tree is stored in ``self.directory_tree``.
+        
+        Args:
+            include_tree (bool): Render the directory tree while walking
+            include_icons (bool): Prefix tree entries with folder/file-type icons
+            max_workers (int): Number of threads used to scan subdirectories
+            
+        Returns:
+            Dict[str, pd.DataFrame]: One DataFrame of report metadata per report type
+        """
+        logger.info(f"Analysing directory: {self.root_directory}")
+        
+        tree_lines, found = self._walk_once(include_tree=include_tree, include_icons=include_icons,
+                                            max_workers=max_workers)
+        if include_tree:
+            self._set_directory_tree(tree_lines)
+        return self._group_reports(found)
+    
+    def _walk_once(self, include_tree: bool = True, include_icons: bool = True, find_reports: bool = True,
+                   max_workers: int = DEFAULT_SCAN_WORKERS) -> Tuple[List[str], List[Tuple[str, ReportRow]]]:
+        """
+        Walk the root directory once, rendering the tree and finding reports.
+        
+        Each top-level subdirectory is walked in its own worker thread, which
+        hides per-file stat latency on network (SMB/NFS) report trees.
+        
+        Args:
+            include_tree (bool): Render the directory tree while walking
+            include_icons (bool): Prefix tree entries with folder/file-type icons
+            find_reports (bool): Collect report metadata while walking
+            max_workers (int): Number of threads used to scan subdirectories
+            
+        Returns:
+            Tuple[List[str], List[Tuple[str, ReportRow]]]: Tree lines and the reports found
+        """
+        if not self.root_directory.is_dir():
+            logger.error(f"Error scanning directory: {self.root_directory} is not a directory")
+            return [], []
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            return self._walk_directory(str(self.root_directory), self.root_directory.name, "",
+                                        include_tree, include_icons, find_reports, executor)
+        except Exception as e:
+            logger.error(f"Error scanning directory: {e}")
+            return [], []
+        finally:
+            # Don't wait for queued subtrees, e.g. after Ctrl-C on a slow share;
+            # on success every future has already been consumed
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _walk_directory(self, path: str, name: str, prefix: str, include_tree: bool, include_icons: bool,
+                        find_reports: bool, executor: Optional[ThreadPoolExecutor] = None
+                        ) -> Tuple[List[str], List[Tuple[str, ReportRow]]]:
+        """
+        Recursively walk one directory with a single os.scandir per level.
+        
+        When an executor is given, subdirectories are walked in worker threads
+        and their results are stitched back in listing order, so the output
+        does not depend on thread scheduling.
+        
+        Args:
+            path (str): Directory to walk
+            name (str): Directory name shown in the tree
+            prefix (str): Tree prefix for this directory's entries
+            include_tree (bool): Render the directory tree while walking
+            include_icons (bool): Prefix tree entries with folder/file-type icons
+            find_reports (bool): Collect report metadata while walking
+            executor (ThreadPoolExecutor, optional): Pool to walk subdirectories in
+            
+        Returns:
+            Tuple[List[str], List[Tuple[str, ReportRow]]]: Tree lines and the reports found
+        """
+        tree_lines: List[str] = []
+        found: List[Tuple[str, ReportRow]] = []
+        folder = f"{FOLDER_ICON} " if include_icons else ""
+        
+        if include_tree:
+            tree_lines.append(f"{prefix}{folder}{name}/")
+        
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except PermissionError as e:
+            logger.warning(f"Could not scan directory: {e}")
+            if include_tree:
+                tree_lines.append(f"{prefix}    [Permission Denied]")
+            return tree_lines, found
+        except OSError as e:
+            logger.warning(f"Could not scan directory: {e}")
+            return tree_lines, found
+        
+        if find_reports:
+            # Relative directory is sliced once per directory, not once per report
+            found.extend(self._find_reports(entries, path[self._root_prefix_len:] or '.'))
+        
+        if include_tree:
+            # Symlinked directories are grouped and labelled as directories
+            entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
+        
+        # Only real directories are descended into; symlinked directories and
+        # directories that never contain reports (skip_dirs) are listed only
+        skip_dirs = self.skip_dirs
+        
+        def descend(entry: os.DirEntry) -> bool:
+            return entry.name not in skip_dirs and entry.is_dir(follow_symlinks=False)
+        
+        def walk_child(i: int, entry: os.DirEntry) -> Tuple[List[str], List[Tuple[str, ReportRow]]]:
+            new_prefix = prefix + ("    " if i == len(entries) - 1 else "│   ")
+            return self._walk_directory(entry.path, entry.name, new_prefix,
+                                        include_tree, include_icons, find_reports)
+        
+        futures = {}
+        if executor is not None:
+            for i, entry in enumerate(entries):
+                if descend(entry):
+                    futures[i] = executor.submit(walk_child, i, entry)
+        
+        for i, entry in enumerate(entries):
+            connector = "└── " if i == len(entries) - 1 else "├── "
+            
+            if descend(entry):
+                try:
+                    sub_lines, sub_found = futures[i].result() if i in futures else walk_child(i, entry)
+                except Exception as e:
+                    # Keep the results of sibling subtrees if one of them fails
+                    logger.error(f"Error scanning directory {entry.path}: {e}")
+                    sub_lines, sub_found = [], []
+                if include_tree:
+                    tree_lines.append(f"{prefix}{connector}{folder}{entry.name}/")
+                    tree_lines.extend(sub_lines)
+                found.extend(sub_found)
+            elif not include_tree:
+                continue
+            elif entry.is_dir():
+                tree_lines.append(f"{prefix}{connector}{folder}{entry.name}/")
+            elif include_icons:
+                icon = self._get_file_icon(os.path.splitext(entry.name)[1])
+                tree_lines.append(f"{prefix}{connector}{icon} {entry.name}")
+            else:
+                tree_lines.append(f"{prefix}{connector}{entry.name}")
+        
+        return tree_lines, found
+    
+    def _group_reports(self, found: List[Tuple[str, ReportRow]]) -> Dict[str, pd.DataFrame]:
+        """
+        Group the reports found by type and build one DataFrame per type.
+        
+        Args:
+            found (List[Tuple[str, ReportRow]]): Report type and raw metadata of each report
+            
+        Returns:
+            Dict[str, pd.DataFrame]: One DataFrame of report metadata per report type
+        """
+        report_rows: Dict[str, List[ReportRow]] = {
             'full_reports': [],
             'metrics_reports': [],
             'testcase_reports': [],
@@ -172,71 +362,129 @@ class VectorCASTReportAnalyser:
             'execution_reports': []
         }
         
-        try:
-            for root, dirs, files in os.walk(self.root_directory):
-                root_path = Path(root)
-                
-                for file in files:
-                    file_path = root_path / file
-                    
-                    # Check against each pattern
-                    for report_type, pattern in self.report_patterns.items():
-                        if re.match(pattern, file, re.IGNORECASE):
-                            report_info = self._extract_report_metadata(file_path)
-                            
-                            # Map report types to data keys
-                            data_key = f"{report_type.replace('_report', '')}_reports"
-                            if report_type == 'testcase_report':
-                                data_key = 'testcase_reports'
-                            
-                            report_data[data_key].append(report_info)
-                            break
+        for report_type, row in found:
+            # Map report types to data keys
+            data_key = f"{report_type.replace('_report', '')}_reports"
+            if report_type == 'testcase_report':
+                data_key = 'testcase_reports'
+            
+            report_rows[data_key].append(row)
         
-        except Exception as e:
-            logger.error(f"Error scanning directory: {e}")
+        report_data = {
+            data_key: self._build_report_frame(rows)
+            for data_key, rows in report_rows.items()
+        }
         
         # Log summary
         total_reports = sum(len(reports) for reports in report_data.values())
         logger.info(f"Found {total_reports} VectorCAST reports")
         
         for report_type, reports in report_data.items():
-            if reports:
+            if not reports.empty:
                 logger.info(f"  - {report_type}: {len(reports)} files")
         
         return report_data
     
-    def _extract_report_metadata(self, file_path: Path) -> Dict[str, Any]:
+    def _find_reports(self, entries: Iterable[os.DirEntry], directory: str) -> List[Tuple[str, ReportRow]]:
+        """
+        Pick out the VectorCAST report files among directory entries.
+        
+        Args:
+            entries (Iterable[os.DirEntry]): Entries to check
+            directory (str): Directory of the entries, relative to the root
+            
+        Returns:
+            List[Tuple[str, ReportRow]]: Report type and raw metadata of each report found
+        """
+        report_suffixes = self.report_suffixes
+        found = []
+        
+        for entry in entries:
+            # Report suffixes are the last two dot-separated parts of the
+            # filename, so a single dict lookup identifies the report type
+            parts = entry.name.lower().rsplit('.', 2)
+            if len(parts) < 3:
+                continue
+            
+            # Anything but a directory counts, so broken symlinks still get a
+            # row (and a warning) from _extract_report_metadata
+            report_type = report_suffixes.get(f".{parts[1]}.{parts[2]}")
+            if report_type is None or entry.is_dir():
+                continue
+            
+            found.append((report_type, self._extract_report_metadata(entry, directory)))
+        
+        return found
+    
+    def _extract_report_metadata(self, entry: os.DirEntry, directory: str) -> ReportRow:
         """
-        Extract metadata from a report file.
+        Extract raw metadata from a report file.
+        
+        Formatting of sizes and dates is left to _build_report_frame, which
+        does it for all reports of a type at once.
         
         Args:
-            file_path (Path): Path to the report file
+            entry (os.DirEntry): Directory entry of the report file
+            directory (str): Directory of the report, relative to the root
             
         Returns:
-            Dict[str, Any]: Report metadata
+            ReportRow: Report metadata, with a size of 0 and no mtime if the
+                file could not be stat'ed
         """
+        relative_path = entry.path[self._root_prefix_len:]
         try:
-            stat_info = file_path.stat()
-            return {
-                'filename': file_path.name,
-                'full_path': str(file_path),
-                'relative_path': str(file_path.relative_to(self.root_directory)),
-                'size_bytes': stat_info.st_size,
-                'size_mb': round(stat_info.st_size / (1024 * 1024), 2),
-                'modified_date': datetime.fromtimestamp(stat_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'directory': str(file_path.parent.relative_to(self.root_directory))
-            }
-        except Exception as e:
-            logger.warning(f"Could not extract metadata for {file_path}: {e}")
-            return {
-                'filename': file_path.name,
-                'full_path': str(file_path),
-                'relative_path': str(file_path.relative_to(self.root_directory)),
-                'size_bytes': 0,
-                'size_mb': 0,
-                'modified_date': 'Unknown',
-                'directory': str(file_path.parent.relative_to(self.root_directory))
-            }
+            stat_info = entry.stat()
+            return (entry.name, entry.path, relative_path, stat_info.st_size, stat_info.st_mtime, directory)
+        except OSError as e:
+            logger.warning(f"Could not extract metadata for {entry.path}: {e}")
+            return (entry.name, entry.path, relative_path, 0, None, directory)
+    
+    def _build_report_frame(self, rows: List[ReportRow]) -> pd.DataFrame:
+        """
+        Build the metadata DataFrame for one report type.
+        
+        Rows are loaded with a fixed schema, so pandas does not have to infer
+        column names or dtypes, and size/date formatting is done on whole
+        columns instead of once per report.
+        
+        Args:
+            rows (List[ReportRow]): Raw metadata gathered during the scan
+            
+        Returns:
+            pd.DataFrame: Report metadata, one row per report file. The raw
+                ``mtime`` column is kept after the REPORT_COLUMNS for summaries.
+        """
+        df = pd.DataFrame.from_records(rows, columns=REPORT_ROW_COLUMNS).astype(REPORT_ROW_DTYPES)
+        
+        df['modified_date'] = self._format_timestamps(df['mtime'])
+        df['size_mb'] = (df['size_bytes'] / (1024 * 1024)).round(2)
+        
+        return df[REPORT_COLUMNS + ['mtime']]
+    
+    def _format_timestamps(self, mtimes: pd.Series) -> pd.Series:
+        """
+        Format POSIX timestamps as local date/time strings.
+        
+        Args:
+            mtimes (pd.Series): Timestamps in seconds, NaN where unknown
+            
+        Returns:
+            pd.Series: 'YYYY-MM-DD HH:MM:SS' strings, 'Unknown' where missing
+        """
+        # Timestamps outside pandas' datetime range (years 1677-2262) become
+        # NaT here and are formatted one by one below instead
+        in_range = mtimes.where(mtimes.abs() < 9.2e9)
+        modified = pd.to_datetime(in_range, unit='s', utc=True, errors='coerce').dt.tz_convert(tzlocal())
+        formatted = modified.dt.strftime('%Y-%m-%d %H:%M:%S').astype(object)
+        
+        out_of_range = modified.isna() & mtimes.notna()
+        for idx in mtimes.index[out_of_range]:
+            try:
+                formatted[idx] = datetime.fromtimestamp(mtimes[idx]).strftime('%Y-%m-%d %H:%M:%S')
+            except (OverflowError, OSError, ValueError):
+                pass
+        
+        return formatted.fillna('Unknown')
     
     def pad_lists_to_same_length(self, *lists: List[Any]) -> List[List[Any]]:
         """
@@ -260,36 +508,37 @@ class VectorCASTReportAnalyser:
         
         return padded_lists
     
-    def create_excel_report(self, output_filename: str = "vectorcast_analysis.xlsx") -> None:
+    def create_excel_report(self, output_filename: str = "vectorcast_analysis.xlsx",
+                            include_tree: bool = True) -> None:
         """
         Create a comprehensive Excel report with multiple sheets.
         
         Args:
             output_filename (str): Output Excel filename
+            include_tree (bool): Generate the directory tree and add it as a sheet
         """
         logger.info(f"Creating Excel report: {output_filename}")
         
         try:
-            # Generate directory tree and scan for reports
-            self.generate_directory_tree()
-            report_data = self.scan_directory_for_reports()
+            # Generate directory tree and scan for reports in one pass
+            report_data = self.analyse_directory(include_tree=include_tree)
             
-            # Create workbook
-            with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
-                
-                # Create summary sheet
-                self._create_summary_sheet(writer, report_data)
-                
-                # Create detailed sheets for each report type
-                for report_type, reports in report_data.items():
-                    if reports:
-                        self._create_report_sheet(writer, report_type, reports)
-                
-                # Create directory tree sheet
-                self._create_directory_tree_sheet(writer)
+            # Create workbook in write-only mode so rows are streamed to disk
+            wb = Workbook(write_only=True)
+            
+            # Create summary sheet
+            self._create_summary_sheet(wb, report_data)
+            
+            # Create detailed sheets for each report type
+            for report_type, reports in report_data.items():
+                if not reports.empty:
+                    self._create_report_sheet(wb, report_type, reports)
             
-            # Apply formatting
-            self._format_excel_file(output_filename)
+            # Create directory tree sheet
+            if include_tree:
+                self._create_directory_tree_sheet(wb)
+            
+            wb.save(output_filename)
             
             logger.info(f"Excel report created successfully: {output_filename}")
             
@@ -297,7 +546,7 @@ class VectorCASTReportAnalyser:
             logger.error(f"Failed to create Excel report: {e}")
             raise
     
-    def _create_summary_sheet(self, writer: pd.ExcelWriter, report_data: Dict[str, List[Dict[str, Any]]]) -> None:
+    def _create_summary_sheet(self, wb: Workbook, report_data: Dict[str, pd.DataFrame]) -> None:
         """Create summary sheet with overview statistics."""
         summary_data = {
             'Report Type': [],
@@ -307,21 +556,27 @@ class VectorCASTReportAnalyser:
             'Latest Modified': []
         }
         
+        latest_mtimes = []
+        
+        # Aggregate the raw byte counts and timestamps, formatting only the results
         for report_type, reports in report_data.items():
-            if reports:
-                total_size = sum(report['size_mb'] for report in reports)
-                avg_size = total_size / len(reports) if reports else 0
-                latest_modified = max(report['modified_date'] for report in reports)
+            if not reports.empty:
+                total_size = reports['size_bytes'].sum() / (1024 * 1024)
+                avg_size = total_size / len(reports)
                 
                 summary_data['Report Type'].append(report_type.replace('_', ' ').title())
                 summary_data['Count'].append(len(reports))
                 summary_data['Total Size (MB)'].append(round(total_size, 2))
                 summary_data['Average Size (MB)'].append(round(avg_size, 2))
-                summary_data['Latest Modified'].append(latest_modified)
+                latest_mtimes.append(reports['mtime'].max())
+        
+        summary_data['Latest Modified'] = self._format_timestamps(
+            pd.Series(latest_mtimes, dtype='float64')
+        ).tolist()
         
         # Add total row
         total_count = sum(len(reports) for reports in report_data.values())
-        total_size = sum(sum(report['size_mb'] for report in reports) for reports in report_data.values())
+        total_size = sum(reports['size_bytes'].sum() for reports in report_data.values()) / (1024 * 1024)
         
         summary_data['Report Type'].append('TOTAL')
         summary_data['Count'].append(total_count)
@@ -330,61 +585,75 @@ class VectorCASTReportAnalyser:
         summary_data['Latest Modified'].append('')
         
         df_summary = pd.DataFrame(summary_data)
-        df_summary.to_excel(writer, sheet_name='Summary', index=False)
+        self._write_sheet(wb, 'Summary', df_summary)
     
-    def _create_report_sheet(self, writer: pd.ExcelWriter, report_type: str, reports: List[Dict[str, Any]]) -> None:
+    def _create_report_sheet(self, wb: Workbook, report_type: str, reports: pd.DataFrame) -> None:
         """Create sheet for specific report type."""
-        df_reports = pd.DataFrame(reports)
         sheet_name = report_type.replace('_', ' ').title()[:31]  # Excel sheet name limit
-        df_reports.to_excel(writer, sheet_name=sheet_name, index=False)
+        self._write_sheet(wb, sheet_name, reports[REPORT_COLUMNS])
     
-    def _create_directory_tree_sheet(self, writer: pd.ExcelWriter) -> None:
+    def _create_directory_tree_sheet(self, wb: Workbook) -> None:
         """Create directory tree sheet."""
-        tree_df = pd.DataFrame({'Directory Structure': self.directory_tree})
-        tree_df.to_excel(writer, sheet_name='Directory Tree', index=False)
+        # Stream the tree lines straight into the sheet instead of copying
+        # them into a DataFrame first; the tree is usually the largest sheet
+        header = 'Directory Structure'
+        max_length = max((len(line) for line in self.directory_tree), default=0)
+        self._write_rows(wb, 'Directory Tree', [header], [max(max_length, len(header))],
+                         ([line] for line in self.directory_tree))
     
-    def _format_excel_file(self, filename: str) -> None:
-        """Apply formatting to the Excel file."""
-        try:
-            from openpyxl import load_workbook
-            
-            wb = load_workbook(filename)
-            
-            # Define styles
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Format each sheet
-            for sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                
-                # Format headers
-                if ws.max_row > 0:
-                    for cell in ws[1]:
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = header_alignment
-                
-                # Auto-adjust column widths
-                for column in ws.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    ws.column_dimensions[column_letter].width = adjusted_width
-            
-            wb.save(filename)
-            
-        except Exception as e:
-            logger.warning(f"Could not apply Excel formatting: {e}")
+    def _write_sheet(self, wb: Workbook, sheet_name: str, df: pd.DataFrame) -> None:
+        """
+        Write a DataFrame to a new sheet of a write-only workbook.
+        
+        Args:
+            wb (Workbook): Write-only workbook to add the sheet to
+            sheet_name (str): Name of the new sheet
+            df (pd.DataFrame): Data to write, column names become the header row
+        """
+        max_lengths = []
+        for col_idx, column in enumerate(df.columns):
+            max_length = len(str(column))
+            if not df.empty:
+                max_length = max(max_length, int(df.iloc[:, col_idx].astype(str).str.len().max()))
+            max_lengths.append(max_length)
+        
+        rows = dataframe_to_rows(df, index=False, header=True)
+        header = next(rows)
+        self._write_rows(wb, sheet_name, header, max_lengths, rows)
+    
+    def _write_rows(self, wb: Workbook, sheet_name: str, header: List[Any],
+                    max_lengths: List[int], rows: Iterable[List[Any]]) -> None:
+        """
+        Stream rows into a new sheet of a write-only workbook.
+        
+        Header cells are styled as they are appended and column widths are
+        set up front, so the saved file needs no second formatting pass.
+        Rows are consumed one at a time and never held by the worksheet.
+        
+        Args:
+            wb (Workbook): Write-only workbook to add the sheet to
+            sheet_name (str): Name of the new sheet
+            header (List[Any]): Header row values
+            max_lengths (List[int]): Longest value length of each column
+            rows (Iterable[List[Any]]): Data rows
+        """
+        ws = wb.create_sheet(sheet_name)
+        
+        # Auto-adjust column widths (must be set before any row is written)
+        for col_idx, max_length in enumerate(max_lengths, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
+        
+        header_cells = []
+        for value in header:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = HEADER_ALIGNMENT
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        for row in rows:
+            ws.append(row)
 
 
 def main():
@@ -400,6 +669,11 @@ def main():
         default='vectorcast_analysis.xlsx',
         help='Output Excel filename (default: vectorcast_analysis.xlsx)'
     )
+    parser.add_argument(
+        '--no-tree',
+        action='store_true',
+        help='Skip generating the directory tree sheet'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -416,7 +690,7 @@ def main():
         logger.info(f"Scanning directory: {args.directory}")
         
         analyzer = VectorCASTReportAnalyser(args.directory)
-        analyzer.create_excel_report(args.output)
+        analyzer.create_excel_report(args.output, include_tree=not args.no_tree)
         
         logger.info("Analysis completed successfully!")
         